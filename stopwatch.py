@@ -2,14 +2,16 @@
 
 import curses
 import sys
-import time
 from curses import A_BOLD, A_NORMAL
 from datetime import datetime, timedelta
 from itertools import pairwise
 
-KEY_NO_INPUT = "\x01"  # No input key (ord(abs(-1)))
 COLUMN_WIDTH = 13
 OFFSET = 0
+REFRESH_MS = 100  # how long getch blocks before a redraw tick
+
+# Lap-row layout, bound once at import and shared by every row:
+ROW_TEMPLATE = "{:3} {} {} {}".format
 
 
 class Formatter:
@@ -28,7 +30,14 @@ class Formatter:
 
     def __init__(self) -> None:
         """Set the initial format to decimal seconds"""
+        self._formatters = {
+            Formatter.FORMAT_DECIMAL_SECONDS: self._ss,
+            Formatter.FORMAT_MINUTES_SECONDS: self._mm_ss,
+            Formatter.FORMAT_HOURS_MINUTES_SECONDS: self._hh_mm_ss,
+            Formatter.FORMAT_HOURS_MINUTES_SECONDS_START: self._hh_mm_ss,
+        }
         self.current_format = Formatter.FORMAT_DECIMAL_SECONDS
+        self._formatter = self._formatters[self.current_format]
         self.month_day = False
 
     @property
@@ -45,6 +54,17 @@ class Formatter:
         icurrent = Formatter.FORMATS.index(self.current_format)
         inext = (icurrent + increment) % len(Formatter.FORMATS)
         self.current_format = Formatter.FORMATS[inext]
+        self._formatter = self._formatters[self.current_format]
+
+    def clock_time(self, dt: datetime) -> str:
+        """
+        Wall-clock text for one timestamp. Integer formatting instead of
+        strftime("%H:%M:%S"): no format-string parsing or locale machinery
+        in the once-per-tick path. The day-month prefix keeps strftime for
+        the month name, but only runs on runs that cross midnight.
+        """
+        hms = f"{dt.hour:02}:{dt.minute:02}:{dt.second:02}"
+        return f"{dt:%d-%b} {hms}" if self.month_day else hms
 
     @classmethod
     def _ss(cls, td: timedelta) -> str:
@@ -66,19 +86,7 @@ class Formatter:
 
     def row_time(self, td: timedelta, offset: int = OFFSET) -> str:
         """Formatted times for the current and total timestamps"""
-        match self.current_format:
-            case Formatter.FORMAT_DECIMAL_SECONDS:
-                formatter = Formatter._ss
-            case Formatter.FORMAT_MINUTES_SECONDS:
-                formatter = Formatter._mm_ss
-            case Formatter.FORMAT_HOURS_MINUTES_SECONDS:
-                formatter = Formatter._hh_mm_ss
-            case Formatter.FORMAT_HOURS_MINUTES_SECONDS_START:
-                formatter = Formatter._hh_mm_ss
-            case _:
-                raise curses.error(" format error row {self.current_format}")
-
-        return f"{formatter(td):>{COLUMN_WIDTH + offset}s}"
+        return self._formatter(td).rjust(COLUMN_WIDTH + offset)
 
     @property
     def buffer_key(self) -> str:
@@ -113,8 +121,17 @@ class Display:
         """Create a StopwatchDisplay object to write with"""
         self.screen = screen
         self.clear_buffer = False
+        self.full_redraw = True  # repaint all rows, not just the live one
+        self._last_live_key: tuple | None = None
+        self._header_rows: list[str] = []
+        self._header_key: tuple | None = None
         self.formatter = Formatter()
         self.verbose = False
+        # Formatted rows for completed laps, valid for _static_key's
+        # (format, month_day) combination. Only the live row changes between
+        # ticks, so completed rows are formatted once and reused.
+        self._static_rows: list[str] = []
+        self._static_key: tuple[str, bool] | None = None
 
         self.init_curses()
         self.set_screen_size()
@@ -124,23 +141,29 @@ class Display:
         """Set curses settings"""
         curses.noecho()
         curses.cbreak()
-        self.screen.nodelay(True)
+        # Don't chase the text cursor around the screen on every update:
+        self.screen.leaveok(True)
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass  # some terminals can't hide the cursor
+        # Block in getch until a key arrives or the next redraw tick is due,
+        # instead of busy-polling with nodelay:
+        self.screen.timeout(REFRESH_MS)
 
     def set_screen_size(self) -> None:
         """Detect and record rows/cols counts"""
         self.num_rows, self.num_cols = self.screen.getmaxyx()
         self.num_header_rows = len(self.header_rows)
         self.num_buffer_rows = self.num_rows - self.num_header_rows
-
-    def blank_line(self) -> str:
-        """Make a blank line"""
-        return " " * (self.num_cols - 1)
+        # Last-written (text, format) per buffer row, for skipping unchanged rows:
+        self._screen_rows: list[tuple[str, int] | None] = [None] * self.num_buffer_rows
 
     def exit_msg(self, timestamps) -> str | None:
         """Generate an exit message"""
         if self.verbose:
             header = self.formatter.buffer_key
-            rows = self.get_rows(timestamps)
+            rows = self.get_rows(timestamps, datetime.now())
             msg = header + "\n" + "\n".join(rows)
         else:
             msg = None
@@ -148,61 +171,113 @@ class Display:
 
     @property
     def header_rows(self) -> list[str]:
-        """Generate header text rows"""
-        return [
-            "Stopwatch:" + (" (verbose mode)" if self.verbose else ""),
-            "  q to quit, space/j/n/m to mark a lap, u/k/p to undo a mark, ",
-            "  slash/y (forward) Y/? (backward) to cycle display format ",
-            "  (seconds / mm:ss / hh:mm:ss)",
-            "  v to toggle verbosity (screen dump vs silent quit)",
-            "",
-            self.formatter.buffer_key,
-        ]
+        """Header text rows, rebuilt only when verbosity or the format changes"""
+        key = (self.verbose, self.formatter.current_format, self.formatter.month_day)
+        if key != self._header_key:
+            self._header_key = key
+            self._header_rows = [
+                "Stopwatch:" + (" (verbose mode)" if self.verbose else ""),
+                "  q to quit, space/j/n/m to mark a lap, u/k/p to undo a mark, ",
+                "  slash/y (forward) Y/? (backward) to cycle display format ",
+                "  (seconds / mm:ss / hh:mm:ss)",
+                "  v to toggle verbosity (screen dump vs silent quit)",
+                "",
+                self.formatter.buffer_key,
+            ]
+        return self._header_rows
 
     def write_header(self) -> None:
         """Write the header (above the display buffer)"""
         for i, header_row in enumerate(self.header_rows):
-            self.screen.addstr(i, 0, self.blank_line())  # clear line
-            self.screen.addstr(i, 0, header_row)
+            # Pad to the screen width so one write both blanks and fills the line:
+            self.screen.addstr(i, 0, header_row.ljust(self.num_cols - 1))
+        self.screen.noutrefresh()
 
-    def get_rows(self, timestamps: list[datetime]) -> str | list[str]:
+    def get_rows(self, timestamps: list[datetime], now: datetime) -> list[str]:
         """Get the rows to display and return them as strings"""
 
+        # Make a COPY of timstamps appended with "now" to generate the lap rows.
+        timestamps = timestamps + [now]
+        self.formatter.month_day = timestamps[-1].date() != timestamps[0].date()
+
+        # Hoist the per-row lookups to locals before the loop:
+        row_time = self.formatter.row_time
+        clock_time = self.formatter.clock_time
+        is_long_format = self.formatter.is_long_format
+        start = timestamps[0]
+
         def _row_text(current: datetime, previous: datetime, lap_num: int) -> str:
-            td_total = current - timestamps[0]
-            lap_duration = self.formatter.row_time(current - previous)
-            total_duration = self.formatter.row_time(td_total, offset=2)
+            lap_duration = row_time(current - previous)
+            total_duration = row_time(current - start, offset=2)
 
-            fmt = "%d-%b %H:%M:%S" if self.formatter.month_day else "%H:%M:%S"
-            time_str = current.strftime(fmt)
-            if self.formatter.is_long_format:
-                time_str = previous.strftime(fmt) + " " + time_str
+            time_str = clock_time(current)
+            if is_long_format:
+                time_str = clock_time(previous) + " " + time_str
 
-            return f"{lap_num:3} {time_str} {lap_duration} {total_duration}"
+            return ROW_TEMPLATE(lap_num, time_str, lap_duration, total_duration)
 
-        # Make a COPY of timstamps appended with "now" to generate the lap rows.
-        timestamps = timestamps + [datetime.now()]
-        self.formatter.month_day = timestamps[-1].date() != timestamps[0].date()
-        rows = [
-            _row_text(timestamp, previous, i + 1)
-            for i, (previous, timestamp) in enumerate(pairwise(timestamps))
-        ]
+        # Invalidate the completed-lap cache if the display format changed:
+        key = (self.formatter.current_format, self.formatter.month_day)
+        if key != self._static_key:
+            self._static_rows.clear()
+            self._static_key = key
+
+        # Completed laps: drop cached rows removed by undo, format new ones once.
+        num_static = len(timestamps) - 2
+        del self._static_rows[num_static:]
+        for i in range(len(self._static_rows), num_static):
+            self._static_rows.append(_row_text(timestamps[i + 1], timestamps[i], i + 1))
 
-        return rows
+        # The live (bottom) row is the only one reformatted every tick:
+        live_row = _row_text(timestamps[-1], timestamps[-2], len(timestamps) - 1)
+        return self._static_rows + [live_row]
 
-    def write_buffer(self, timestamps: list[datetime]) -> None:
+    def write_buffer(self, timestamps: list[datetime], now: datetime) -> None:
         """Write the lap info for each lap into the display buffer"""
 
-        rows = self.get_rows(timestamps)
+        # On an idle tick only the live (bottom, bold) row can have changed,
+        # so skip the full row sweep. Lap add/remove, format changes, and
+        # resizes go through check_clear, which requests a full repaint.
+        if not self.full_redraw:
+            if (now.date() != timestamps[0].date()) != self.formatter.month_day:
+                # Midnight rollover: the day-month prefix appears in every
+                # row and in the header's Time column, not just the live
+                # row, so fall through to a full in-place repaint.
+                self.check_clear()
+            else:
+                # Skip the redraw entirely if the live row's displayed time
+                # bucket (deciseconds for the ss.s format, else whole
+                # seconds) is the one already on screen: mm:ss modes redraw
+                # at 1 Hz, not 10 Hz.
+                is_decimal = (
+                    self.formatter.current_format == Formatter.FORMAT_DECIMAL_SECONDS
+                )
+                mult = 10 if is_decimal else 1
+                live_key = (
+                    len(timestamps),
+                    self.formatter.current_format,
+                    now.second,
+                    int((now - timestamps[-1]).total_seconds() * mult),
+                    int((now - timestamps[0]).total_seconds() * mult),
+                )
+                if live_key == self._last_live_key:
+                    return
+                self._last_live_key = live_key
+
+                rows = self.get_rows(timestamps, now)
+                istop = len(timestamps)
+                istart = max(istop - self.num_buffer_rows, 0)
+                self._write_buffer_row(istop - 1 - istart, rows[-1], A_BOLD)
+                self.screen.noutrefresh()
+                return
+
+        rows = self.get_rows(timestamps, now)
 
         if self.clear_buffer:
-            curses.resizeterm(*self.screen.getmaxyx())
-            self.screen.clear()
-            self.screen.refresh()
+            # Repaint in place: every row write is padded to the screen width,
+            # so rewriting the header and rows covers the old content without
+            # the blank-frame flash of a full screen.clear() + refresh().
             self.write_header()
-            # TODO: replace the above redraw with this: (for all the rows)?
-            #for all buffer rows:
-            #    self._clear_row(row_num)
 
         # Write visible lines (the last num_buffer_rows timestamps) to buffer.
         # If the buffer has rotated, clear_buffer will be true, so erase each
@@ -222,18 +297,30 @@ class Display:
         # Turn off clear_buffer if it is on:
         if self.clear_buffer:
             self.clear_buffer = False
+        self.full_redraw = False
+
+        # Stage this window's changes; the caller issues one doupdate per frame.
+        self.screen.noutrefresh()
 
     def _write_buffer_row(self, lap_num: int, text: str, fmt: int = A_NORMAL) -> None:
-        """Write formatted text to a line in the display buffer"""
-        row = self.num_header_rows + (lap_num % self.num_buffer_rows)
+        """
+        Write formatted text to a line in the display buffer, skipping the
+        write if the row already shows exactly this text/format.
+        """
+        index = lap_num % self.num_buffer_rows
+        if self._screen_rows[index] == (text, fmt):
+            return
+        self._screen_rows[index] = (text, fmt)
         try:
-            self.screen.addstr(row, 0, text, fmt)
+            # Pad to the screen width so one write both blanks and fills the row:
+            row_text = text.ljust(self.num_cols - 1)
+            self.screen.addstr(self.num_header_rows + index, 0, row_text, fmt)
         except curses.error:
             pass
 
     def _clear_row(self, lap_num: int) -> None:
-        """Erase one row"""
-        self._write_buffer_row(lap_num, self.blank_line())
+        """Erase one row (an empty write pads out to the full screen width)"""
+        self._write_buffer_row(lap_num, "")
 
     def check_clear(self, num_rows: int = 9999):
         """
@@ -241,6 +328,7 @@ class Display:
         display, or if called without args.
         """
         self.clear_buffer = num_rows > self.num_buffer_rows
+        self.full_redraw = True
         # TODO: check if width of text in new format is too large (start-stop
         # to other format) so the text on the right isn't left hanging
 
@@ -248,6 +336,18 @@ class Display:
 class Stopwatch:
     """Class to emulate a stopwatch"""
 
+    # Keystroke-to-method-name dispatch, built once at import instead of per
+    # instance, and keyed on the raw ints getch returns (no chr() per key):
+    KEYSTROKE_ACTIONS: dict[int, str] = {
+        **dict.fromkeys(map(ord, " jnm\n"), "add_timestamp"),  # add a lap
+        **dict.fromkeys(map(ord, "ukp"), "remove_timestamp"),  # remove a lap
+        **dict.fromkeys(map(ord, "/y"), "_next_format"),  # cycle display formats
+        **dict.fromkeys(map(ord, "Y?"), "_prev_format"),  # cycle display formats
+        ord("v"): "_toggle_verbose",  # toggle verbosity
+        ord("q"): "_quit",  # quit
+        curses.KEY_RESIZE: "_resize",  # handle a resize event
+    }
+
     def __init__(self, screen: curses.window) -> None:
         """Create a Stopwatch object"""
         try:
@@ -257,21 +357,6 @@ class Stopwatch:
 
         self.timestamps = [datetime.now()]
 
-        self.keystroke_actions = {
-            **dict.fromkeys(" jnm\n", self.add_timestamp),  # add a lap
-            **dict.fromkeys("ukp", self.remove_timestamp),  # remove a lap
-            **dict.fromkeys("/y", self._next_format),  # cycle display formats
-            **dict.fromkeys("Y?", self._prev_format),  # cycle display formats
-            "v": self._toggle_verbose,  # toggle verbosity
-            "q": self._quit,  # quit
-            str(curses.KEY_RESIZE): self._resize,  # handle a resize event
-            KEY_NO_INPUT: self._no_input,
-        }
-
-    def _no_input(self) -> None:
-        """Raise this specific error so that the buffer will get written"""
-        raise curses.error("no keyboard input")
-
     def _quit(self, msg: str | None = None) -> None:
         if msg is None:
             msg = self.display.exit_msg(self.timestamps)
@@ -314,15 +399,21 @@ class Stopwatch:
     def run(self) -> None:
         """Run the stopwatch"""
         while True:
+            key = self.display.screen.getch()  # blocks up to REFRESH_MS
+            if key != -1:
+                # Drain any burst of pending keys (held key, paste) so the
+                # whole batch is applied before rendering a single frame:
+                self.display.screen.timeout(0)
+                while key != -1:
+                    if action := self.KEYSTROKE_ACTIONS.get(key):
+                        getattr(self, action)()
+                    key = self.display.screen.getch()
+                self.display.screen.timeout(REFRESH_MS)
             try:
-                key_input = chr(abs(self.display.screen.getch()))
-                if action := self.keystroke_actions.get(key_input):
-                    action()
-                if curses.is_term_resized(self.display.num_rows, self.display.num_cols):
-                    self._resize()
+                self.display.write_buffer(self.timestamps, datetime.now())
+                curses.doupdate()
             except curses.error:
-                self.display.write_buffer(self.timestamps)
-                time.sleep(0.1)
+                pass  # e.g. terminal shrunk mid-draw; retry on the next tick
 
 
 def main(screen: curses.window) -> None:
@@ -5,107 +5,178 @@ Word Clock: print times of different cities to the terminal
 from argparse import ArgumentParser
 import csv
 import datetime
+import math
+import sys
+from difflib import get_close_matches
+from functools import lru_cache
 from pathlib import Path
-
-import pytz
-import suntime
-from termcolor import colored
+from zoneinfo import ZoneInfo
 
 
 DEFAULT_TIME_FORMAT = "%H:%M %a %Z"
-SHORT_LIST_NAMES = ["Berkeley", "Copenhagen"]
+SHORT_LIST_NAMES = frozenset({"Berkeley", "Copenhagen"})
+DIM = "\x1b[90m"  # ANSI dark grey, for cities where it is night
+RESET = "\x1b[0m"
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@lru_cache(maxsize=None)
+def _declination(day_of_year: int) -> float:
+    """Solar declination in radians for one day of the year (city-independent)"""
+    return math.radians(-23.44 * math.cos(2 * math.pi * (day_of_year + 10) / 365))
 
 
 class City:
     """A city with time zone and lat/lng information."""
 
+    __slots__ = ("name", "name_lower", "tz", "lat", "lng")
+
     def __init__(self, name: str, tz: str, lat: float | str, lng: float | str) -> None:
         self.name = name
-        self.tz = pytz.timezone(tz)
-        self.lat = lat if isinstance(lat, float) else float(lat)
-        self.lng = lng if isinstance(lng, float) else float(lng)
+        self.name_lower = name.lower()
+        self.tz = ZoneInfo(tz)
+        self.lat = float(lat)
+        self.lng = float(lng)
 
-    def nowtz(self) -> datetime.datetime:
-        """The current datetime object in a city's time zone."""
-        return datetime.datetime.now(self.tz)
-
-    def nowtz_text(self, fmt: str = DEFAULT_TIME_FORMAT) -> str:
-        """The current time formatted text in a specified city's time zone."""
-        return self.nowtz().strftime(fmt)
-
-    def _get_suntimes(self) -> tuple[datetime.time, datetime.time]:
+    def nowtz(self, now_utc: datetime.datetime | None = None) -> datetime.datetime:
         """
-        Determine sunrise or sunset time for a city
-
-        The sunset/sunrise variables are datetime.times (no date info)
-        because suntime seems to return the most recent sunrise or sunset (e.g.
-        sunset will be yesterday).
+        The current datetime object in a city's time zone. Callers printing
+        several cities can read the clock once and pass it in.
         """
-        sun = suntime.Sun(self.lat, self.lng)
-        sunrise = sun.get_sunrise_time()
-        sunset = sun.get_sunset_time()
-        return sunrise.astimezone(self.tz).time(), sunset.astimezone(self.tz).time()
+        if now_utc is None:
+            now_utc = datetime.datetime.now(datetime.timezone.utc)
+        return now_utc.astimezone(self.tz)
+
+    def nowtz_text(
+        self, fmt: str = DEFAULT_TIME_FORMAT, now_utc: datetime.datetime | None = None
+    ) -> str:
+        """The current time formatted text in a specified city's time zone."""
+        now = self.nowtz(now_utc)
+        if fmt == DEFAULT_TIME_FORMAT:
+            # Build the stock format directly, skipping strftime's re-parse
+            return f"{now.hour:02}:{now.minute:02} {DAY_NAMES[now.weekday()]} {now.tzname()}"
+        return now.strftime(fmt)
 
     @property
     def is_night(self) -> bool:
+        """Whether it is night in the city at this moment"""
+        return self._is_night(datetime.datetime.now(datetime.timezone.utc))
+
+    def _is_night(self, utc: datetime.datetime) -> bool:
         """
-        Determine if it is day or night in a city now, using the sunrise and
-        sunset times. If the sun either didn't set today (local winter at
-        extreme lattitudes) or didn't rise (local summer), figure out which and
-        return if the sun is up or not.
+        Determine if it is day or night in a city now, by comparing the sun's
+        current hour angle against the half-day arc for today's solar
+        declination (a dozen trig ops, good to a few minutes -- plenty for
+        shading a city row). The out-of-range arc cases are the polar ones:
+        the sun never rises (local winter) or never sets (local summer).
         """
-        try:
-            current_time = self.nowtz().time()
-            sunrise, sunset = self._get_suntimes()
-            return current_time < sunrise or current_time > sunset
-        except suntime.SunTimeException:
-            month = self.nowtz().month
-            winter_northern = month < 4 or month > 10 # very roughly, between solstices
-            return winter_northern and self.lat > 0
-
-    def printstr(self, fmt: str, do_lat_lng: bool) -> str:
+        declination = _declination(utc.timetuple().tm_yday)
+
+        cos_half_day = -math.tan(math.radians(self.lat)) * math.tan(declination)
+        if cos_half_day >= 1:
+            return True  # polar night: the sun never rises today
+        if cos_half_day <= -1:
+            return False  # midnight sun: the sun never sets today
+        half_day = math.degrees(math.acos(cos_half_day))
+
+        # Hour angle: degrees the sun is past local solar noon, in (-180, 180]
+        solar_hours = utc.hour + utc.minute / 60 + self.lng / 15
+        hour_angle = (solar_hours - 12) * 15 % 360
+        if hour_angle > 180:
+            hour_angle -= 360
+        return abs(hour_angle) > half_day
+
+    def printstr(
+        self,
+        width: int,
+        do_lat_lng: bool,
+        now_utc: datetime.datetime | None = None,
+        color: bool = True,
+    ) -> str:
         """Generate the city info in a string for printing"""
-        msg = self._name_time(fmt)
+        if now_utc is None:
+            now_utc = datetime.datetime.now(datetime.timezone.utc)
+        msg = self._name_time(width, now_utc)
         if do_lat_lng:
             msg += self._latlng_fmt()
-        if self.is_night:
-            msg = colored(msg, "dark_grey")
+        if color and self._is_night(now_utc):
+            msg = f"{DIM}{msg}{RESET}"
         return msg
 
-    def _name_time(self, fmt) -> str:
-        """City name / time with formatting"""
-        return f"{self.name:{fmt}s} {self.nowtz_text():{fmt}s}"
+    def _name_time(self, width: int, now_utc: datetime.datetime | None = None) -> str:
+        """City name / time padded to the column width"""
+        return (
+            f"{self.name.ljust(width)} {self.nowtz_text(now_utc=now_utc).ljust(width)}"
+        )
 
     def _latlng_fmt(self, fmt: str = "-7.2f") -> str:
         """City lat / lng with formatting"""
         return f"{self.lat:{fmt}} {self.lng:{fmt}}"
 
 
-def load_cities(filename: str | Path, home_base: str) -> list[City]:
-    """Cities sorted by longitude"""
-    with open(filename) as file:
-        cities = [City(*row) for row in csv.reader(file)]
-
-    cities = sorted(cities, key=lambda c: c.lng)
-    cities = rotate_list(cities, home_base)
-    return cities
+@lru_cache(maxsize=None)
+def _read_city_rows(filename: str | Path) -> tuple[tuple[str, ...], ...]:
+    """Read the city CSV once per file and cache the raw rows"""
+    with open(filename, newline="") as file:
+        return tuple(tuple(row) for row in csv.reader(file))
 
 
-def filter_cities(
-    cities: list[City], show_all: bool, requested_cities: list[str]
+def load_cities(
+    filename: str | Path,
+    home_base: str,
+    show_all: bool = False,
+    requested_cities: list[str] | None = None,
 ) -> list[City]:
     """
-    Filter the list of cities to either be a) just the short list, b) just the
-    specified cities, or c) everything if requested.
+    The cities to display, sorted by longitude. Rows are filtered before City
+    construction so timezone/suntime setup only happens for displayed cities.
+    """
+    rows = filter_rows(_read_city_rows(filename), show_all, requested_cities)
+    cities = sorted((City(*row) for row in rows), key=lambda c: c.lng)
+    return rotate_list(cities, home_base)
+
+
+def filter_rows(
+    rows: tuple[tuple[str, ...], ...], show_all: bool, requested_cities: list[str] | None
+) -> list[tuple[str, ...]]:
+    """
+    Filter the raw city rows to either be a) just the short list, b) just the
+    specified cities, or c) everything if requested. Requested names match
+    case-insensitively on substrings, so "berk" finds Berkeley; names with no
+    substring hit fall back to fuzzy matching, so "Berkley" works too.
     """
     if show_all:
-        filtered_cities = cities
+        filtered_rows = list(rows)
     elif requested_cities:
-        filtered_cities = [c for c in cities if c.name in requested_cities]
+        names = [row[0].lower() for row in rows]
+        keep = set()
+        for requested in (name.lower() for name in requested_cities):
+            hits = [n for n in names if requested in n]
+            keep.update(hits or get_close_matches(requested, names, n=1))
+        filtered_rows = [row for row, name in zip(rows, names) if name in keep]
     else:
-        filtered_cities = [c for c in cities if c.name in SHORT_LIST_NAMES]
+        filtered_rows = [row for row in rows if row[0] in SHORT_LIST_NAMES]
 
-    return filtered_cities
+    return filtered_rows
+
+
+def group_cities(cities: list[City]) -> list[City]:
+    """
+    Merge cities sharing a time zone into one "A / B" entry, so the time,
+    and the night shading behind it, is computed once per zone. The merged
+    entry keeps the first member's coordinates and list position.
+    """
+    groups: dict[str, list[City]] = {}
+    for city in cities:
+        groups.setdefault(city.tz.key, []).append(city)
+    return [
+        cluster[0]
+        if len(cluster) == 1
+        else City(
+            " / ".join(c.name for c in cluster), key, cluster[0].lat, cluster[0].lng
+        )
+        for key, cluster in groups.items()
+    ]
 
 
 def rotate_list(cities: list[City], home: str) -> list[City]:
@@ -113,11 +184,10 @@ def rotate_list(cities: list[City], home: str) -> list[City]:
     If possible, rotate the list so that the city named home (city.name == home)
     is first. If home is specified but not in the list of cities, return the list unchanged.
     """
-    try:
-        i = [i for i, c in enumerate(cities) if c.name.lower() == home.lower()][0]
+    home_lower = home.lower()
+    i = next((i for i, c in enumerate(cities) if c.name_lower == home_lower), None)
+    if i is not None:
         cities = cities[i:] + cities[:i]
-    except ValueError:
-        pass  # catch value error from .index if home is not in the list of names
     return cities
 
 
@@ -149,6 +219,13 @@ def parse_args():
         default="Berkeley",
         help="The name of your home city (will be displayed first).",
     )
+    parser.add_argument(
+        "-g",
+        "--group",
+        action="store_true",
+        default=False,
+        help="Group cities that share a time zone onto one line.",
+    )
     parser.add_argument(
         "-c",
         "--requested-cities",
@@ -177,11 +254,24 @@ def parse_args():
 def main():
     """Display the list"""
     args = parse_args()
-    cities = load_cities(args.city_file, args.home_base)
-    cities = filter_cities(cities, args.show_all, args.requested_cities)
+    cities = load_cities(
+        args.city_file, args.home_base, args.show_all, args.requested_cities
+    )
 
-    for city in cities:
-        print(city.printstr(args.column_width, args.lat_lng))
+    width = args.column_width
+    if args.group:
+        cities = group_cities(cities)
+        # Merged "A / B" names can outgrow the column; widen it to match so
+        # the time column stays aligned down the whole listing.
+        width = max([width] + [len(city.name) + 1 for city in cities])
+
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    color = sys.stdout.isatty()  # no night shading (or solar math) when piped
+    lines = [
+        city.printstr(width, args.lat_lng, now_utc, color) for city in cities
+    ]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":